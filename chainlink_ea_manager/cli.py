@@ -8,18 +8,10 @@ import sys
 import argparse
 import logging
 import colorama
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from chainlink_ea_manager.core.manager import EAManager
-
-# Initialize colorama
-colorama.init()
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s"
-)
+if TYPE_CHECKING:
+    from chainlink_ea_manager.core.manager import EAManager
 
 # ANSI escape codes for formatting
 BOLD = colorama.Style.BRIGHT
@@ -27,10 +19,27 @@ RESET = colorama.Style.RESET_ALL
 UNDERLINE = "\033[4m"
 NO_UNDERLINE = "\033[24m"
 
+_color_initialized = False
+
+def _bold(text: str) -> str:
+    """Wrap text in the bold/reset escape codes"""
+    return BOLD + text + RESET
+    
+def _ensure_color():
+    """Initialize colorama the first time formatted output is printed"""
+    global _color_initialized
+    if not _color_initialized:
+        colorama.init()
+        _color_initialized = True
+        
 def setup_parser() -> argparse.ArgumentParser:
     """
     Set up the argument parser for the CLI
     
+    Each subcommand registers a handler via set_defaults(func=...). The
+    handlers import EAManager themselves, so commands such as version or
+    help never pay for loading the manager.
+    
     Returns:
         The configured argument parser
     """
@@ -40,96 +49,141 @@ def setup_parser() -> argparse.ArgumentParser:
         epilog="""
 Examples:
   # Initialize the environment
-  ea-manager -i
+  ea-manager initialize
   
   # Deploy a new adapter
-  ea-manager -d coingecko
+  ea-manager deploy coingecko
   
   # Upgrade an existing adapter
-  ea-manager -u coingecko
+  ea-manager upgrade coingecko
   
   # Test an adapter
-  ea-manager -t coingecko-redis LINK USD
+  ea-manager test coingecko-redis LINK USD
   
   # List all supported adapters
-  ea-manager -l
+  ea-manager list
 """
     )
     
-    # Add arguments
     parser.add_argument(
-        "-i", "--initialize",
+        "-v", "--version",
         action="store_true",
+        help="Print the version and exit"
+    )
+    
+    subparsers = parser.add_subparsers(dest="cmd", metavar="COMMAND")
+    
+    # Add subcommands
+    initialize_parser = subparsers.add_parser(
+        "initialize",
         help="Initialize a generic EA environment"
     )
+    initialize_parser.set_defaults(func=_cmd_initialize)
     
-    parser.add_argument(
-        "-d", "--deploy",
-        metavar="ADAPTER",
+    deploy_parser = subparsers.add_parser(
+        "deploy",
         help="Deploy a new external adapter"
     )
+    deploy_parser.add_argument("adapter", metavar="ADAPTER")
+    deploy_parser.add_argument(
+        "--tag",
+        help="Specify a specific tag to deploy"
+    )
+    deploy_parser.set_defaults(func=_cmd_deploy)
     
-    parser.add_argument(
-        "-u", "--upgrade",
-        metavar="ADAPTER",
+    upgrade_parser = subparsers.add_parser(
+        "upgrade",
         help="Upgrade an existing external adapter"
     )
+    upgrade_parser.add_argument("adapter", metavar="ADAPTER")
+    upgrade_parser.add_argument(
+        "--tag",
+        help="Specify a specific tag to upgrade to"
+    )
+    upgrade_parser.set_defaults(func=_cmd_upgrade)
     
-    parser.add_argument(
-        "-t", "--test",
-        metavar="CONTAINER",
+    test_parser = subparsers.add_parser(
+        "test",
         help="Send a test request to the specified adapter container"
     )
+    test_parser.add_argument("container", metavar="CONTAINER")
+    test_parser.add_argument(
+        "params",
+        nargs="*",
+        help="Parameters for the test request (FROM and TO)"
+    )
+    test_parser.set_defaults(func=_cmd_test)
     
-    parser.add_argument(
-        "-l", "--list",
-        action="store_true",
+    list_parser = subparsers.add_parser(
+        "list",
         help="List all supported external adapters"
     )
+    list_parser.set_defaults(func=_cmd_list)
     
-    parser.add_argument(
-        "-v", "--version",
-        action="store_true",
+    version_parser = subparsers.add_parser(
+        "version",
         help="Print the version and exit"
     )
-    
-    parser.add_argument(
-        "params",
-        nargs="*",
-        help="Additional parameters for test request (FROM and TO)"
-    )
-    
-    parser.add_argument(
-        "--tag",
-        help="Specify a specific tag to deploy or upgrade"
-    )
+    version_parser.set_defaults(func=_cmd_version)
     
     return parser
     
 def print_version():
     """Print the version information"""
+    _ensure_color()
     version = "0.1.0"
-    print(f"Chainlink EA Manager version: {BOLD}{version}{RESET}")
+    print("Chainlink EA Manager version: " + _bold(version))
     
-def initialize_environment(manager: EAManager):
+def initialize_environment(manager: "EAManager"):
     """
     Initialize the environment
     
     Args:
         manager: The EA Manager instance
     """
-    print(f"{BOLD}Initializing new Docker environment...{RESET}")
+    _ensure_color()
+    print(_bold("Initializing new Docker environment..."))
     
     if manager.initialize_environment():
-        print(f"\n{BOLD}Redis container info:{RESET}")
+        print("\n" + _bold("Redis container info:"))
         print("containerName: redis-cache")
         print("IPaddress: 192.168.1.1")
         print("listnPort: 6379")
     else:
-        print(f"{BOLD}Failed to initialize environment{RESET}")
+        print(_bold("Failed to initialize environment"))
         sys.exit(1)
         
-def deploy_adapter(manager: EAManager, adapter_name: str, tag: Optional[str]):
+def _prompt_for_tag(manager: "EAManager", adapter_name: str) -> str:
+    """
+    Prompt the user to select one of the available tags for an adapter
+    
+    Args:
+        manager: The EA Manager instance
+        adapter_name: Name of the adapter
+        
+    Returns:
+        The selected tag
+    """
+    tags = manager.get_available_tags(adapter_name)
+    if not tags:
+        print(_bold(f"No tags found for {adapter_name}"))
+        sys.exit(1)
+        
+    print(f"Available tags for {adapter_name}:")
+    for i, tag_name in enumerate(tags):
+        print(f"{i}) {tag_name}")
+        
+    while True:
+        try:
+            selection = input(f"Select a tag (0-{len(tags)-1}): ")
+            index = int(selection)
+            if 0 <= index < len(tags):
+                return tags[index]
+            print(f"Invalid selection. Please enter a number between 0 and {len(tags)-1}.")
+        except ValueError:
+            print("Invalid input. Please enter a number.")
+            
+def deploy_adapter(manager: "EAManager", adapter_name: str, tag: Optional[str]):
     """
     Deploy a new adapter
     
@@ -138,38 +192,19 @@ def deploy_adapter(manager: EAManager, adapter_name: str, tag: Optional[str]):
         adapter_name: Name of the adapter to deploy
         tag: Specific tag to deploy (optional)
     """
+    _ensure_color()
     # If a tag was not specified, get available tags and prompt the user
-    if not tag:
-        tags = manager.get_available_tags(adapter_name)
-        if not tags:
-            print(f"{BOLD}No tags found for {adapter_name}{RESET}")
-            sys.exit(1)
-            
-        print(f"Available tags for {adapter_name}:")
-        for i, tag_name in enumerate(tags):
-            print(f"{i}) {tag_name}")
-            
-        while True:
-            try:
-                selection = input(f"Select a tag (0-{len(tags)-1}): ")
-                index = int(selection)
-                if 0 <= index < len(tags):
-                    tag = tags[index]
-                    break
-                else:
-                    print(f"Invalid selection. Please enter a number between 0 and {len(tags)-1}.")
-            except ValueError:
-                print("Invalid input. Please enter a number.")
-                
-    print(f"{BOLD}Deploying {adapter_name} at version {tag}{RESET}")
+    tag = tag or _prompt_for_tag(manager, adapter_name)
+    
+    print(_bold(f"Deploying {adapter_name} at version {tag}"))
     
     if manager.deploy_adapter(adapter_name, tag):
-        print(f"{BOLD}Successfully deployed {adapter_name} adapter{RESET}")
+        print(_bold(f"Successfully deployed {adapter_name} adapter"))
     else:
-        print(f"{BOLD}Failed to deploy {adapter_name} adapter{RESET}")
+        print(_bold(f"Failed to deploy {adapter_name} adapter"))
         sys.exit(1)
         
-def upgrade_adapter(manager: EAManager, adapter_name: str, tag: Optional[str]):
+def upgrade_adapter(manager: "EAManager", adapter_name: str, tag: Optional[str]):
     """
     Upgrade an existing adapter
     
@@ -178,38 +213,19 @@ def upgrade_adapter(manager: EAManager, adapter_name: str, tag: Optional[str]):
         adapter_name: Name of the adapter to upgrade
         tag: Specific tag to upgrade to (optional)
     """
+    _ensure_color()
     # If a tag was not specified, get available tags and prompt the user
-    if not tag:
-        tags = manager.get_available_tags(adapter_name)
-        if not tags:
-            print(f"{BOLD}No tags found for {adapter_name}{RESET}")
-            sys.exit(1)
-            
-        print(f"Available tags for {adapter_name}:")
-        for i, tag_name in enumerate(tags):
-            print(f"{i}) {tag_name}")
-            
-        while True:
-            try:
-                selection = input(f"Select a tag (0-{len(tags)-1}): ")
-                index = int(selection)
-                if 0 <= index < len(tags):
-                    tag = tags[index]
-                    break
-                else:
-                    print(f"Invalid selection. Please enter a number between 0 and {len(tags)-1}.")
-            except ValueError:
-                print("Invalid input. Please enter a number.")
-                
-    print(f"{BOLD}Stopping, removing, and redeploying {adapter_name} at version {tag}{RESET}")
+    tag = tag or _prompt_for_tag(manager, adapter_name)
+    
+    print(_bold(f"Stopping, removing, and redeploying {adapter_name} at version {tag}"))
     
     if manager.upgrade_adapter(adapter_name, tag):
-        print(f"{BOLD}Successfully upgraded {adapter_name} adapter{RESET}")
+        print(_bold(f"Successfully upgraded {adapter_name} adapter"))
     else:
-        print(f"{BOLD}Failed to upgrade {adapter_name} adapter{RESET}")
+        print(_bold(f"Failed to upgrade {adapter_name} adapter"))
         sys.exit(1)
         
-def test_adapter(manager: EAManager, container_name: str, params: List[str]):
+def test_adapter(manager: "EAManager", container_name: str, params: List[str]):
     """
     Test an adapter by sending a request
     
@@ -218,34 +234,36 @@ def test_adapter(manager: EAManager, container_name: str, params: List[str]):
         container_name: Name of the container to test
         params: List of parameters (FROM and TO)
     """
+    _ensure_color()
     if len(params) < 2:
-        print(f"{BOLD}Error: Missing parameters for test{RESET}")
-        print("Usage: ea-manager -t CONTAINER FROM TO")
+        print(_bold("Error: Missing parameters for test"))
+        print("Usage: ea-manager test CONTAINER FROM TO")
         sys.exit(1)
         
     from_param = params[0]
     to_param = params[1]
     
-    print(f"{BOLD}Container:{RESET} {container_name}")
-    print(f"{BOLD}FROM:{RESET}      {from_param}")
-    print(f"{BOLD}TO:{RESET}        {to_param}")
+    print(_bold("Container:") + " " + container_name)
+    print(_bold("FROM:") + "      " + from_param)
+    print(_bold("TO:") + "        " + to_param)
     
     result = manager.test_adapter(container_name, from_param, to_param)
     
     if result is not None:
-        print(f"{BOLD}{from_param} / {to_param} --> {RESET}{result}")
+        print(_bold(f"{from_param} / {to_param} --> ") + str(result))
     else:
-        print(f"{BOLD}Failed to test adapter{RESET}")
+        print(_bold("Failed to test adapter"))
         sys.exit(1)
         
-def list_adapters(manager: EAManager):
+def list_adapters(manager: "EAManager"):
     """
     List all supported adapters
     
     Args:
         manager: The EA Manager instance
     """
-    print(f"{BOLD}Listing Supported EAs:{RESET}")
+    _ensure_color()
+    print(_bold("Listing Supported EAs:"))
     print("")
     
     adapters = manager.get_supported_adapters()
@@ -255,27 +273,66 @@ def list_adapters(manager: EAManager):
     else:
         print("  No supported adapters found")
         
+def _create_manager() -> "EAManager":
+    """
+    Create the EA Manager for commands that need it
+    
+    The import is deferred so that commands which never touch Docker or the
+    configuration files do not pay for loading them.
+    
+    Returns:
+        A new EA Manager instance
+    """
+    from chainlink_ea_manager.core.manager import EAManager
+    return EAManager()
+    
+def _cmd_initialize(args: argparse.Namespace):
+    """Handler for the initialize subcommand"""
+    initialize_environment(_create_manager())
+    
+def _cmd_deploy(args: argparse.Namespace):
+    """Handler for the deploy subcommand"""
+    deploy_adapter(_create_manager(), args.adapter, args.tag)
+    
+def _cmd_upgrade(args: argparse.Namespace):
+    """Handler for the upgrade subcommand"""
+    upgrade_adapter(_create_manager(), args.adapter, args.tag)
+    
+def _cmd_test(args: argparse.Namespace):
+    """Handler for the test subcommand"""
+    test_adapter(_create_manager(), args.container, args.params)
+    
+def _cmd_list(args: argparse.Namespace):
+    """Handler for the list subcommand"""
+    list_adapters(_create_manager())
+    
+def _cmd_version(args: argparse.Namespace):
+    """Handler for the version subcommand"""
+    print_version()
+    
 def main():
     """Main entry point for the CLI"""
     parser = setup_parser()
     args = parser.parse_args()
     
-    # Create the EA Manager
-    manager = EAManager()
+    # Set up logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s"
+    )
+    
+    # None of the formats used reference thread, process or caller details,
+    # so skip collecting them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
     
-    # Process the commands
+    # Dispatch to the selected subcommand
     if args.version:
         print_version()
-    elif args.initialize:
-        initialize_environment(manager)
-    elif args.deploy:
-        deploy_adapter(manager, args.deploy, args.tag)
-    elif args.upgrade:
-        upgrade_adapter(manager, args.upgrade, args.tag)
-    elif args.test:
-        test_adapter(manager, args.test, args.params)
-    elif args.list:
-        list_adapters(manager)
+    elif getattr(args, "func", None):
+        args.func(args)
     else:
         parser.print_help()
         
@@ -8,11 +8,35 @@ import re
 import json
 import yaml
 import logging
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 
+# Prefer the libyaml C bindings when available
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 logger = logging.getLogger(__name__)
 
+# Version of the adapter cache format; bump it whenever the way adapter
+# scripts are parsed changes so caches written by older code are discarded
+_ADAPTER_CACHE_VERSION = 1
+
+# Maximum number of bytes read from each adapter script
+_ADAPTER_READ_LIMIT = 8192
+
+# Patterns used to parse the adapter scripts and the shell variable files
+_ADAPTER_RE = re.compile(
+    r'--ip\s+(?P<ip>\d+\.\d+\.\d+\.\d+)'
+    r'|-p\s+(?P<port>\d+):\d+'
+    r'|-e\s+API_KEY=\$(?P<api_key_var>[A-Za-z0-9_]+)'
+    r'|-e\s+RATE_LIMIT_API_TIER=\$(?P<sub_tier_var>[A-Za-z0-9_]+)'
+)
+_RPC_RE = re.compile(r'([A-Za-z0-9_]+)_RPC_URL=([^\n]*)')
+_CHAINID_RE = re.compile(r'([A-Za-z0-9_]+)_CHAIN_ID=([^\n]*)')
+
 class ConfigManager:
     """
     Manages configuration for the Chainlink EA Manager
@@ -35,19 +59,40 @@ class ConfigManager:
             self.config_path = config_path
             self.config_dir = os.path.dirname(config_path)
             
+        self.adapter_cache_path = os.path.join(self.config_dir, "adapter_cache.json")
+            
         # Create directory if it doesn't exist
-        if not os.path.exists(self.config_dir):
-            os.makedirs(self.config_dir)
+        os.makedirs(self.config_dir, exist_ok=True)
             
         # Load or create configuration
         self.config = self._load_or_create_config()
         
-        # Load API keys and chain variables from original config files
-        self.api_keys = self._load_api_keys()
-        self.chain_vars = self._load_chain_vars()
+        # API keys, chain variables and adapter configurations are loaded on
+        # first access, since most commands only need some of them
+        self._api_keys = None
+        self._chain_vars = None
+        self._adapter_configs = None
+        
+    @property
+    def api_keys(self) -> Dict:
+        """API keys loaded from the api_keys file"""
+        if self._api_keys is None:
+            self._api_keys = self._load_api_keys()
+        return self._api_keys
         
-        # Create adapter configurations
-        self.adapter_configs = self._create_adapter_configs()
+    @property
+    def chain_vars(self) -> Dict:
+        """Chain variables loaded from the misc_vars file"""
+        if self._chain_vars is None:
+            self._chain_vars = self._load_chain_vars()
+        return self._chain_vars
+        
+    @property
+    def adapter_configs(self) -> Dict:
+        """Adapter configurations parsed from the externalAdapters directory"""
+        if self._adapter_configs is None:
+            self._adapter_configs = self._create_adapter_configs()
+        return self._adapter_configs
         
     def _load_or_create_config(self) -> Dict:
         """
@@ -56,39 +101,40 @@ class ConfigManager:
         Returns:
             The configuration dictionary
         """
-        if os.path.exists(self.config_path):
-            try:
-                with open(self.config_path, 'r') as f:
-                    config = yaml.safe_load(f)
-                    if not config:
-                        config = {}
-                    return config
-            except Exception as e:
-                self.logger.error(f"Failed to load configuration: {str(e)}")
-                return {}
-        else:
-            # Create default configuration
-            default_config = {
-                "redis": {
-                    "host": "192.168.1.1",
-                    "port": 6379,
-                    "maxclients": 2500
-                },
-                "docker": {
-                    "network_name": "eas-net",
-                    "subnet": "192.168.0.0/16",
-                    "gateway": "192.168.0.1"
-                },
-                "adapters": {}
-            }
+        try:
+            with open(self.config_path, 'r') as f:
+                config = yaml.load(f, Loader=SafeLoader)
+                if not config:
+                    config = {}
+                return config
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.error("Failed to load configuration: %s", e)
+            return {}
             
-            try:
-                with open(self.config_path, 'w') as f:
-                    yaml.dump(default_config, f)
-                return default_config
-            except Exception as e:
-                self.logger.error(f"Failed to create configuration: {str(e)}")
-                return default_config
+        # Create default configuration
+        default_config = {
+            "redis": {
+                "host": "192.168.1.1",
+                "port": 6379,
+                "maxclients": 2500
+            },
+            "docker": {
+                "network_name": "eas-net",
+                "subnet": "192.168.0.0/16",
+                "gateway": "192.168.0.1"
+            },
+            "adapters": {}
+        }
+        
+        try:
+            with open(self.config_path, 'w') as f:
+                yaml.dump(default_config, f, Dumper=SafeDumper)
+            return default_config
+        except Exception as e:
+            self.logger.error("Failed to create configuration: %s", e)
+            return default_config
                 
     def _load_api_keys(self) -> Dict:
         """
@@ -106,15 +152,18 @@ class ConfigManager:
                     content = f.read()
                     
                 # Extract export statements
-                export_pattern = re.compile(r'export\s+(\w+)=([^\n]*)')
-                matches = export_pattern.findall(content)
-                
-                for name, value in matches:
+                for line in content.splitlines():
+                    parts = line.split(None, 1)
+                    if len(parts) != 2 or parts[0] != "export":
+                        continue
+                        
+                    name, sep, value = parts[1].partition('=')
+                    if not sep:
+                        continue
+                        
                     # Clean up the value (remove quotes, etc.)
                     value = value.strip()
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
+                    if value[:1] in ('"', "'") and value[-1:] == value[:1] and len(value) > 1:
                         value = value[1:-1]
                         
                     api_keys[name] = value
@@ -122,10 +171,10 @@ class ConfigManager:
                 return api_keys
                 
             except Exception as e:
-                self.logger.error(f"Failed to load API keys: {str(e)}")
+                self.logger.error("Failed to load API keys: %s", e)
                 return {}
         else:
-            self.logger.warning(f"API keys file not found: {api_keys_path}")
+            self.logger.warning("API keys file not found: %s", api_keys_path)
             return {}
             
     def _load_chain_vars(self) -> Dict:
@@ -144,11 +193,8 @@ class ConfigManager:
                     content = f.read()
                     
                 # Extract RPC URLs and chain IDs
-                rpc_pattern = re.compile(r'([A-Za-z0-9_]+)_RPC_URL=([^\n]*)')
-                chain_id_pattern = re.compile(r'([A-Za-z0-9_]+)_CHAIN_ID=([^\n]*)')
-                
-                rpc_matches = rpc_pattern.findall(content)
-                chain_id_matches = chain_id_pattern.findall(content)
+                rpc_matches = _RPC_RE.findall(content)
+                chain_id_matches = _CHAINID_RE.findall(content)
                 
                 # Process RPC URLs
                 for chain, url in rpc_matches:
@@ -167,21 +213,24 @@ class ConfigManager:
                         try:
                             chain_vars[chain]['chain_id'] = int(chain_id)
                         except ValueError:
-                            self.logger.warning(f"Invalid chain ID for {chain}: {chain_id}")
+                            self.logger.warning("Invalid chain ID for %s: %s", chain, chain_id)
                             
                 return chain_vars
                 
             except Exception as e:
-                self.logger.error(f"Failed to load chain variables: {str(e)}")
+                self.logger.error("Failed to load chain variables: %s", e)
                 return {}
         else:
-            self.logger.warning(f"Misc vars file not found: {misc_vars_path}")
+            self.logger.warning("Misc vars file not found: %s", misc_vars_path)
             return {}
             
     def _create_adapter_configs(self) -> Dict:
         """
         Create adapter configurations based on the files in the externalAdapters directory
         
+        The parsed configurations are cached in adapter_cache.json and reused
+        as long as no adapter script has been added, removed or modified.
+        
         Returns:
             Dictionary of adapter configurations
         """
@@ -190,52 +239,121 @@ class ConfigManager:
         
         if os.path.exists(adapters_dir):
             try:
-                for adapter_file in os.listdir(adapters_dir):
-                    adapter_path = os.path.join(adapters_dir, adapter_file)
-                    
-                    # Skip directories and non-executable files
-                    if os.path.isdir(adapter_path) or not os.access(adapter_path, os.X_OK):
-                        continue
+                # Collect a (mtime, size) signature for every adapter script
+                signature = {}
+                adapter_paths = {}
+                with os.scandir(adapters_dir) as entries:
+                    for entry in entries:
+                        # Skip directories and non-executable files
+                        if not entry.is_file():
+                            continue
+                            
+                        stat = entry.stat()
+                        if not stat.st_mode & 0o111:
+                            continue
+                            
+                        signature[entry.name] = [stat.st_mtime_ns, stat.st_size]
+                        adapter_paths[entry.name] = entry.path
                         
-                    adapter_name = adapter_file
+                # Reuse the cached configurations if nothing has changed
+                cached_configs = self._load_adapter_cache(adapters_dir, signature)
+                if cached_configs is not None:
+                    return cached_configs
                     
-                    # Extract configuration from the adapter script
+                for adapter_name, adapter_path in adapter_paths.items():
+                    # Extract configuration from the adapter script. The docker run
+                    # arguments we need are all near the top of the file.
                     with open(adapter_path, 'r') as f:
-                        content = f.read()
+                        content = f.read(_ADAPTER_READ_LIMIT)
                         
-                    # Extract IP address
-                    ip_match = re.search(r'--ip\s+(\d+\.\d+\.\d+\.\d+)', content)
-                    ip = ip_match.group(1) if ip_match else None
-                    
-                    # Extract port
-                    port_match = re.search(r'-p\s+(\d+):(\d+)', content)
-                    port = port_match.group(1) if port_match else None
-                    
-                    # Extract API key variable name
-                    api_key_match = re.search(r'-e\s+API_KEY=\$([A-Za-z0-9_]+)', content)
-                    api_key_var = api_key_match.group(1) if api_key_match else None
-                    
-                    # Extract subscription tier variable name
-                    sub_tier_match = re.search(r'-e\s+RATE_LIMIT_API_TIER=\$([A-Za-z0-9_]+)', content)
-                    sub_tier_var = sub_tier_match.group(1) if sub_tier_match else None
-                    
+                    # Extract IP, port, API key and subscription tier variables in a
+                    # single pass, keeping the first occurrence of each field
+                    fields = dict.fromkeys(_ADAPTER_RE.groupindex)
+                    for match in _ADAPTER_RE.finditer(content):
+                        for key, value in match.groupdict().items():
+                            if value and fields[key] is None:
+                                fields[key] = value
+                                
                     # Create adapter configuration
-                    adapter_configs[adapter_name] = {
-                        'ip': ip,
-                        'port': port,
-                        'api_key_var': api_key_var,
-                        'sub_tier_var': sub_tier_var
-                    }
+                    adapter_configs[adapter_name] = fields
                     
+                self._save_adapter_cache(adapters_dir, signature, adapter_configs)
                 return adapter_configs
                 
             except Exception as e:
-                self.logger.error(f"Failed to create adapter configurations: {str(e)}")
+                self.logger.error("Failed to create adapter configurations: %s", e)
                 return {}
         else:
-            self.logger.warning(f"External adapters directory not found: {adapters_dir}")
+            self.logger.warning("External adapters directory not found: %s", adapters_dir)
             return {}
             
+    def _load_adapter_cache(self, adapters_dir: str, signature: Dict) -> Optional[Dict]:
+        """
+        Load cached adapter configurations if they are still up to date
+        
+        Args:
+            adapters_dir: Path to the externalAdapters directory
+            signature: Mapping of adapter file names to [mtime_ns, size]
+            
+        Returns:
+            The cached adapter configurations, or None if the cache is missing or stale
+        """
+        try:
+            with open(self.adapter_cache_path, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+            
+        if (cache.get('version') != _ADAPTER_CACHE_VERSION
+                or cache.get('adapters_dir') != adapters_dir
+                or cache.get('sig') != signature):
+            return None
+            
+        return cache.get('configs')
+        
+    def _save_adapter_cache(self, adapters_dir: str, signature: Dict, adapter_configs: Dict):
+        """
+        Save adapter configurations to the cache file
+        
+        Args:
+            adapters_dir: Path to the externalAdapters directory
+            signature: Mapping of adapter file names to [mtime_ns, size]
+            adapter_configs: The parsed adapter configurations
+        """
+        cache = {
+            'version': _ADAPTER_CACHE_VERSION,
+            'adapters_dir': adapters_dir,
+            'sig': signature,
+            'configs': adapter_configs
+        }
+        
+        # Write to a temporary file and rename it so readers never see a
+        # partially written cache
+        tmp_path = None
+        try:
+            cache_dir = os.path.dirname(self.adapter_cache_path)
+            with tempfile.NamedTemporaryFile('w', dir=cache_dir, delete=False) as f:
+                tmp_path = f.name
+                json.dump(cache, f)
+            os.replace(tmp_path, self.adapter_cache_path)
+        except OSError as e:
+            self.logger.warning("Failed to write adapter cache: %s", e)
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except FileNotFoundError:
+                    pass
+            
+    def warm_cache(self):
+        """
+        Load API keys and adapter configurations up front
+        
+        Call this before looking up configuration from several threads so the
+        files are only read once.
+        """
+        self.api_keys
+        self.adapter_configs
+        
     def get_adapter_config(self, adapter_name: str) -> Optional[Dict]:
         """
         Get the configuration for a specific adapter
@@ -306,8 +424,8 @@ class ConfigManager:
         """
         try:
             with open(self.config_path, 'w') as f:
-                yaml.dump(self.config, f)
+                yaml.dump(self.config, f, Dumper=SafeDumper)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to save configuration: {str(e)}")
+            self.logger.error("Failed to save configuration: %s", e)
             return False
\ No newline at end of file
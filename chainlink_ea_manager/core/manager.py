@@ -6,34 +6,225 @@ Main module for managing Chainlink External Adapters
 
 import os
 import json
+import heapq
 import yaml
 import logging
+import time
 import subprocess
+import tempfile
+import types
+import functools
 import docker
-from typing import Dict, List, Optional, Union
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple, Union
 
 from chainlink_ea_manager.utils.docker_utils import ensure_docker_running
 from chainlink_ea_manager.config.config_manager import ConfigManager
 from chainlink_ea_manager.utils.logger import get_logger
 
+# Prefer orjson for JSON encoding/decoding when it is installed
+try:
+    from orjson import loads as _json_loads, dumps as _json_dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+# How long cached tag listings are reused, in seconds
+TAG_CACHE_TTL = 300
+
+# Connections kept open to the Docker daemon, sized for deploy_many/test_many
+DOCKER_MAX_POOL_SIZE = 32
+
+# Environment variables shared by every adapter container
+_BASE_ENV = types.MappingProxyType({
+    'CACHE_ENABLED': 'true',
+    'CACHE_TYPE': 'redis',
+    'CACHE_REDIS_HOST': '192.168.1.1',
+    'CACHE_REDIS_PORT': '6379',
+    'CACHE_REDIS_TIMEOUT': '10000',
+    'RATE_LIMIT_ENABLED': 'true',
+    'WARMUP_ENABLED': 'true',
+    'REQUEST_COALESCING_ENABLED': 'true',
+    'REQUEST_COALESCING_INTERVAL': '100',
+    'REQUEST_COALESCING_INTERVAL_MAX': '1000',
+    'REQUEST_COALESCING_INTERVAL_COEFFICIENT': '2',
+    'REQUEST_COALESCING_ENTROPY_MAX': '0',
+    'LOG_LEVEL': 'info',
+    'DEBUG': 'false',
+    'API_VERBOSE': 'false',
+    'EXPERIMENTAL_METRICS_ENABLED': 'true',
+    'RETRY': '1',
+    'TIMEOUT': '30000'
+})
+
+# Headers sent with adapter test requests
+_JSON_HEADERS = types.MappingProxyType({"Content-Type": "application/json"})
+
+# Prometheus labels shared by every adapter container
+_BASE_LABELS = types.MappingProxyType({
+    'prometheus-scrape.enabled': 'true',
+    'prometheus-scrape.port': '9080',
+    'prometheus-scrape.metrics_path': '/metrics'
+})
+
+
+@functools.lru_cache(maxsize=128)
+def _encode_test_body(from_param: str, to_param: str) -> bytes:
+    """
+    Encode the JSON body of an adapter test request
+    
+    Args:
+        from_param: FROM parameter for the test request
+        to_param: TO parameter for the test request
+        
+    Returns:
+        The encoded request body
+    """
+    return _json_dumps({"data": {"from": from_param, "to": to_param}})
+    
+def _eas_net_ip(container) -> Optional[str]:
+    """
+    Get the address of a container on the eas-net network
+    
+    Args:
+        container: The Docker container
+        
+    Returns:
+        The IP address, or None if the container's attributes do not list one
+    """
+    try:
+        return container.attrs['NetworkSettings']['Networks']['eas-net']['IPAddress'] or None
+    except (KeyError, TypeError):
+        return None
+        
 
 class EAManager:
     """Manager for Chainlink External Adapters"""
     
-    def __init__(self, config_path: str = None, log_dir: str = None):
+    __slots__ = (
+        'logger',
+        'config',
+        'docker_client',
+        '_networks',
+        '_containers_by_name',
+        '_container_index_complete',
+        '_http',
+        '_tag_cache_dir',
+        '_tag_ttl',
+        'op_logger',
+    )
+    
+    def __init__(self, config_path: str = None, log_dir: str = None, json_logs: bool = False):
         """
         Initialize the External Adapter Manager
         
         Args:
             config_path: Path to the configuration file. If None, uses default location.
             log_dir: Directory to store log files. If None, uses default location.
+            json_logs: Whether to write operation logs as JSON lines
         """
         self.logger = logging.getLogger(__name__)
         self.config = ConfigManager(config_path)
-        self.docker_client = docker.from_env()
+        self.docker_client = docker.from_env(max_pool_size=DOCKER_MAX_POOL_SIZE)
+        
+        # Docker objects looked up during this session, keyed by name
+        self._networks = {}
+        self._containers_by_name = {}
+        
+        # True once refresh_container_index() has listed every container
+        self._container_index_complete = False
+        
+        # HTTP session reused for adapter test requests (keep-alive)
+        self._http = requests.Session()
+        self._http.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+        
+        # Tag listings from skopeo are cached on disk for a short time
+        self._tag_cache_dir = os.path.join(self.config.config_dir, "tags")
+        self._tag_ttl = TAG_CACHE_TTL
         
         # Initialize operation logger
-        self.op_logger = get_logger(log_dir)
+        self.op_logger = get_logger(log_dir, json_logs)
+        
+    def _get_network(self, name: str):
+        """
+        Get a Docker network, reusing the object from an earlier lookup
+        
+        Args:
+            name: Name of the network
+            
+        Returns:
+            The Docker network
+            
+        Raises:
+            docker.errors.NotFound: If the network does not exist
+        """
+        network = self._networks.get(name)
+        if network is None:
+            network = self.docker_client.networks.get(name)
+            self._networks[name] = network
+        return network
+        
+    def _find_container(self, name: str):
+        """
+        Find a container by name, reusing the object from an earlier lookup
+        
+        Args:
+            name: Name of the container
+            
+        Returns:
+            The Docker container, or None if it does not exist
+        """
+        container = self._containers_by_name.get(name)
+        if container is None:
+            # A complete index means the container does not exist
+            if self._container_index_complete:
+                return None
+            try:
+                container = self.docker_client.containers.get(name)
+            except docker.errors.NotFound:
+                return None
+            self._containers_by_name[name] = container
+        return container
+        
+    def _reload_container(self, name: str, container):
+        """
+        Refresh the attributes of a cached container
+        
+        Containers returned by containers.run() carry the attributes from
+        before they were connected to the network, so they are reloaded once
+        the connection is made. If the reload fails the container is dropped
+        from the cache and looked up again when next needed.
+        
+        Args:
+            name: Name of the container
+            container: The Docker container
+        """
+        try:
+            container.reload()
+        except Exception as e:
+            self.logger.warning("Failed to refresh container %s: %s", name, e)
+            self._containers_by_name.pop(name, None)
+            
+    def refresh_container_index(self):
+        """
+        Index all containers by name with a single Docker API call
+        
+        Callers that deploy or upgrade many adapters should call this once up
+        front so that each existence check is a dictionary lookup. The listing
+        is sparse, so containers are not inspected one by one; the indexed
+        objects carry the list endpoint's attributes, which include the
+        network settings.
+        """
+        self._containers_by_name = {
+            container.attrs['Names'][0].lstrip('/'): container
+            for container in self.docker_client.containers.list(all=True, sparse=True)
+            if container.attrs.get('Names')
+        }
+        self._container_index_complete = True
         
     def initialize_environment(self) -> bool:
         """
@@ -51,14 +242,14 @@ class EAManager:
         if not ensure_docker_running():
             return False
             
-        # Create Docker network if it doesn't exist
+        # Create Docker network, letting the daemon reject duplicates
         try:
-            networks = self.docker_client.networks.list(names=['eas-net'])
-            if not networks:
+            try:
                 self.logger.info("Creating Docker network...")
-                self.docker_client.networks.create(
+                self._networks['eas-net'] = self.docker_client.networks.create(
                     name='eas-net',
                     driver='bridge',
+                    check_duplicate=True,
                     ipam=docker.types.IPAMConfig(
                         pool_configs=[docker.types.IPAMPool(
                             subnet='192.168.0.0/16',
@@ -67,27 +258,22 @@ class EAManager:
                     )
                 )
                 self.logger.info("Docker network created successfully")
-            else:
+            except docker.errors.APIError as e:
+                if e.status_code != 409 and 'already exists' not in str(e):
+                    raise
                 self.logger.info("Docker network already exists")
                 
             # Create Redis directory for volume if it doesn't exist
             redis_dir = os.path.expanduser('~/.redis')
-            if not os.path.exists(redis_dir):
-                self.logger.info("Creating Redis volume directory...")
-                os.makedirs(redis_dir)
+            os.makedirs(redis_dir, exist_ok=True)
                 
             # Check if Redis container already exists
-            existing_containers = self.docker_client.containers.list(
-                all=True, 
-                filters={"name": "redis-cache"}
-            )
-            
-            if existing_containers:
+            if self._find_container('redis-cache') is not None:
                 self.logger.info("Redis container already exists")
             else:
                 # Deploy Redis container
                 self.logger.info("Deploying Redis container...")
-                self.docker_client.containers.run(
+                container = self.docker_client.containers.run(
                     image='redis',
                     name='redis-cache',
                     detach=True,
@@ -98,18 +284,20 @@ class EAManager:
                     command='redis-server --maxclients 2500'
                 )
                 
+                self._containers_by_name['redis-cache'] = container
+                
                 # Connect container to the network with specific IP
+                network = self._get_network('eas-net')
                 try:
-                    container = self.docker_client.containers.get('redis-cache')
-                    network = self.docker_client.networks.get('eas-net')
                     network.connect(container, ipv4_address='192.168.1.1')
                 except Exception as e:
-                    self.logger.warning(f"Failed to set static IP for Redis: {str(e)}")
+                    self.logger.warning("Failed to set static IP for Redis: %s", e)
                     # If setting IP fails, just connect to the network without a static IP
                     try:
                         network.connect(container)
                     except Exception as inner_e:
-                        self.logger.error(f"Failed to connect Redis to network: {str(inner_e)}")
+                        self.logger.error("Failed to connect Redis to network: %s", inner_e)
+                self._reload_container('redis-cache', container)
                 self.logger.info("Redis container deployed successfully")
                 
             self.logger.info("Environment initialization completed successfully")
@@ -132,6 +320,11 @@ class EAManager:
         Returns:
             List of available tags
         """
+        # Reuse a recent listing if one is cached
+        cached_tags = self._load_cached_tags(adapter_name)
+        if cached_tags is not None:
+            return cached_tags
+            
         repo = f"public.ecr.aws/chainlink/adapters/{adapter_name}-adapter"
         
         try:
@@ -144,18 +337,102 @@ class EAManager:
             )
             
             # Parse the output
-            tags_data = json.loads(result.stdout)
-            tags = sorted(tags_data.get('Tags', []), reverse=True)
+            tags_data = _json_loads(result.stdout)
             
             # Return top 10 tags
-            return tags[:10]
+            tags = heapq.nlargest(10, tags_data.get('Tags', []))
+            
+            # Do not cache an empty listing, so a transient registry result
+            # does not hide the tags for the whole TTL
+            if tags:
+                self._save_cached_tags(adapter_name, tags)
+            return tags
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to get tags for {adapter_name}: {e}")
+            self.logger.error("Failed to get tags for %s: %s", adapter_name, e)
             return []
         except json.JSONDecodeError as e:
-            self.logger.error(f"Failed to parse tags for {adapter_name}: {e}")
+            self.logger.error("Failed to parse tags for %s: %s", adapter_name, e)
             return []
             
+    def _tag_cache_path(self, adapter_name: str) -> str:
+        """
+        Get the path of the tag cache file for an adapter
+        
+        Args:
+            adapter_name: Name of the adapter
+            
+        Returns:
+            Path to the cache file
+        """
+        return os.path.join(self._tag_cache_dir, f"{adapter_name}.json")
+        
+    def _load_cached_tags(self, adapter_name: str) -> Optional[List[str]]:
+        """
+        Load cached tags for an adapter if they are younger than the TTL
+        
+        Args:
+            adapter_name: Name of the adapter
+            
+        Returns:
+            List of cached tags, or None if there is no fresh cache entry
+        """
+        cache_path = self._tag_cache_path(adapter_name)
+        try:
+            if time.time() - os.stat(cache_path).st_mtime >= self._tag_ttl:
+                return None
+            with open(cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+            
+    def _save_cached_tags(self, adapter_name: str, tags: List[str]):
+        """
+        Atomically write the tags for an adapter to the cache
+        
+        Args:
+            adapter_name: Name of the adapter
+            tags: List of tags to cache
+        """
+        tmp_path = None
+        try:
+            os.makedirs(self._tag_cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=self._tag_cache_dir, delete=False) as f:
+                tmp_path = f.name
+                json.dump(tags, f)
+            os.replace(tmp_path, self._tag_cache_path(adapter_name))
+        except OSError as e:
+            self.logger.warning("Failed to cache tags for %s: %s", adapter_name, e)
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except FileNotFoundError:
+                    pass
+            
+    def invalidate_tag_cache(self, adapter_name: str = None):
+        """
+        Remove cached tag listings
+        
+        Args:
+            adapter_name: Name of the adapter. If None, clears the cache for all adapters
+        """
+        if adapter_name:
+            cache_paths = [self._tag_cache_path(adapter_name)]
+        else:
+            try:
+                cache_paths = [
+                    os.path.join(self._tag_cache_dir, name)
+                    for name in os.listdir(self._tag_cache_dir)
+                    if name.endswith('.json')
+                ]
+            except FileNotFoundError:
+                return
+                
+        for cache_path in cache_paths:
+            try:
+                os.remove(cache_path)
+            except FileNotFoundError:
+                pass
+                
     def deploy_adapter(self, adapter_name: str, tag: str = None) -> bool:
         """
         Deploy a new External Adapter
@@ -167,59 +444,43 @@ class EAManager:
         Returns:
             bool: True if successful, False otherwise
         """
+        # Load adapter configuration before looking up tags, which needs a
+        # registry call
+        adapter_config = self.config.get_adapter_config(adapter_name)
+        if not adapter_config:
+            self.logger.error("No configuration found for adapter %s", adapter_name)
+            return False
+            
         # Get available tags if not specified
         if not tag:
             tags = self.get_available_tags(adapter_name)
             if not tags:
-                self.logger.error(f"No tags found for {adapter_name}")
+                self.logger.error("No tags found for %s", adapter_name)
                 return False
                 
             # In a CLI tool, we would prompt the user here
             # For now, just use the latest tag
             tag = tags[0]
             
-        # Load adapter configuration
-        adapter_config = self.config.get_adapter_config(adapter_name)
-        if not adapter_config:
-            self.logger.error(f"No configuration found for adapter {adapter_name}")
-            return False
-            
         # Check if the Docker network exists
         try:
-            networks = self.docker_client.networks.list(names=['eas-net'])
-            if not networks:
-                self.logger.error("Docker network 'eas-net' does not exist. Please run 'ea-manager -i' first.")
-                return False
+            self._get_network('eas-net')
+        except docker.errors.NotFound:
+            self.logger.error("Docker network 'eas-net' does not exist. Please run 'ea-manager initialize' first.")
+            return False
         except Exception as e:
-            self.logger.error(f"Failed to check Docker networks: {str(e)}")
+            self.logger.error("Failed to check Docker networks: %s", e)
             return False
             
         try:
             # Create environment variables dictionary
-            env_vars = {
+            env_vars = dict(_BASE_ENV)
+            env_vars.update({
                 'EA_PORT': adapter_config.get('port', '1113'),
-                'CACHE_ENABLED': 'true',
-                'CACHE_TYPE': 'redis',
                 'CACHE_KEY_GROUP': adapter_name,
-                'CACHE_REDIS_HOST': '192.168.1.1',
-                'CACHE_REDIS_PORT': '6379',
-                'CACHE_REDIS_TIMEOUT': '10000',
-                'RATE_LIMIT_ENABLED': 'true',
-                'WARMUP_ENABLED': 'true',
                 'RATE_LIMIT_API_PROVIDER': adapter_name,
-                'REQUEST_COALESCING_ENABLED': 'true',
-                'REQUEST_COALESCING_INTERVAL': '100',
-                'REQUEST_COALESCING_INTERVAL_MAX': '1000', 
-                'REQUEST_COALESCING_INTERVAL_COEFFICIENT': '2',
-                'REQUEST_COALESCING_ENTROPY_MAX': '0',
-                'LOG_LEVEL': 'info',
-                'DEBUG': 'false',
-                'API_VERBOSE': 'false',
-                'EXPERIMENTAL_METRICS_ENABLED': 'true',
-                'METRICS_NAME': adapter_name,
-                'RETRY': '1',
-                'TIMEOUT': '30000'
-            }
+                'METRICS_NAME': adapter_name
+            })
             
             # Add API key if available
             api_key = self.config.get_api_key(adapter_name)
@@ -236,18 +497,14 @@ class EAManager:
             image_name = f"public.ecr.aws/chainlink/adapters/{adapter_name}-adapter:{tag}"
             
             # Check if container already exists
-            existing_containers = self.docker_client.containers.list(
-                all=True, 
-                filters={"name": container_name}
-            )
-            
-            if existing_containers:
-                self.logger.warning(f"Container {container_name} already exists. Removing...")
-                for container in existing_containers:
-                    container.remove(force=True)
-                    
+            existing_container = self._find_container(container_name)
+            if existing_container is not None:
+                self.logger.warning("Container %s already exists. Removing...", container_name)
+                existing_container.remove(force=True)
+                self._containers_by_name.pop(container_name, None)
+                
             # Deploy new container
-            self.logger.info(f"Deploying {adapter_name} adapter with tag {tag}")
+            self.logger.info("Deploying %s adapter with tag %s", adapter_name, tag)
             
             ip_address = adapter_config.get('ip', '192.168.1.113')
             port = adapter_config.get('port', '1113')
@@ -259,7 +516,7 @@ class EAManager:
                 }
             }
             
-            self.docker_client.containers.run(
+            container = self.docker_client.containers.run(
                 image=image_name,
                 name=container_name,
                 detach=True,
@@ -267,28 +524,25 @@ class EAManager:
                 network_mode=None,  # We'll connect it to the network separately
                 ports={f"{port}/tcp": int(port)},
                 environment=env_vars,
-                labels={
-                    'prometheus-scrape.enabled': 'true',
-                    'prometheus-scrape.job_name': container_name,
-                    'prometheus-scrape.port': '9080',
-                    'prometheus-scrape.metrics_path': '/metrics'
-                }
+                labels={**_BASE_LABELS, 'prometheus-scrape.job_name': container_name}
             )
             
+            self._containers_by_name[container_name] = container
+            
             # Connect container to the network with specific IP
+            network = self._get_network('eas-net')
             try:
-                container = self.docker_client.containers.get(container_name)
-                network = self.docker_client.networks.get('eas-net')
                 network.connect(container, ipv4_address=ip_address)
             except Exception as e:
-                self.logger.warning(f"Failed to set static IP: {str(e)}")
+                self.logger.warning("Failed to set static IP: %s", e)
                 # If setting IP fails, just connect to the network without a static IP
                 try:
                     network.connect(container)
                 except Exception as inner_e:
-                    self.logger.error(f"Failed to connect to network: {str(inner_e)}")
+                    self.logger.error("Failed to connect to network: %s", inner_e)
+            self._reload_container(container_name, container)
             
-            self.logger.info(f"Successfully deployed {adapter_name} adapter")
+            self.logger.info("Successfully deployed %s adapter", adapter_name)
             self.op_logger.log_deploy(adapter_name, tag, True)
             return True
             
@@ -298,6 +552,86 @@ class EAManager:
             self.op_logger.log_deploy(adapter_name, tag, False, error_msg)
             return False
             
+    def deploy_many(self, specs: List[Tuple[str, Optional[str]]], max_workers: int = 8) -> Dict[str, bool]:
+        """
+        Deploy several External Adapters concurrently
+        
+        Args:
+            specs: List of (adapter_name, tag) pairs. A tag of None deploys the latest tag
+            max_workers: Maximum number of adapters deployed at the same time
+            
+        Returns:
+            Dictionary mapping each adapter name to whether its deployment succeeded
+        """
+        results = {}
+        if not specs:
+            return results
+            
+        # Load shared configuration and Docker state once so the workers only
+        # read the caches
+        self.config.warm_cache()
+        try:
+            self.refresh_container_index()
+            self._get_network('eas-net')
+        except Exception as e:
+            self.logger.warning("Failed to prefetch Docker state: %s", e)
+            
+        # Resolve missing tags and pull the images in parallel before deploying
+        specs = self._prefetch_images(specs, max_workers)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.deploy_adapter, adapter_name, tag): adapter_name
+                for adapter_name, tag in specs
+            }
+            for future in as_completed(futures):
+                adapter_name = futures[future]
+                try:
+                    results[adapter_name] = future.result()
+                except Exception as e:
+                    self.logger.error("Failed to deploy %s adapter: %s", adapter_name, e)
+                    results[adapter_name] = False
+                    
+        return results
+        
+    def _prefetch_images(self, specs: List[Tuple[str, Optional[str]]],
+                         max_workers: int = 8) -> List[Tuple[str, Optional[str]]]:
+        """
+        Resolve missing tags and pull the images for several adapters concurrently
+        
+        Each worker looks up the latest tag for its adapter if none was given
+        and then pulls the image, so neither the tag listings nor the pulls run
+        one after another. Images that are already present make the pull a
+        no-op. Adapters without a configuration are skipped, since
+        deploy_adapter rejects them anyway.
+        
+        Args:
+            specs: List of (adapter_name, tag) pairs. A tag of None uses the latest tag
+            max_workers: Maximum number of adapters handled at the same time
+            
+        Returns:
+            The specs in the same order, with tags resolved where possible
+        """
+        def prefetch(spec):
+            adapter_name, tag = spec
+            if self.config.get_adapter_config(adapter_name) is None:
+                return spec
+                
+            if not tag:
+                tag = next(iter(self.get_available_tags(adapter_name)), None)
+                if not tag:
+                    return spec
+                    
+            repo = f"public.ecr.aws/chainlink/adapters/{adapter_name}-adapter"
+            try:
+                self.docker_client.images.pull(repo, tag=tag)
+            except Exception as e:
+                self.logger.warning("Failed to pull image for %s: %s", adapter_name, e)
+            return (adapter_name, tag)
+            
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(specs))) as executor:
+            return list(executor.map(prefetch, specs))
+            
     def upgrade_adapter(self, adapter_name: str, tag: str = None) -> bool:
         """
         Upgrade an existing External Adapter
@@ -312,22 +646,18 @@ class EAManager:
         container_name = f"{adapter_name}-redis"
         
         # Check if container exists
-        existing_containers = self.docker_client.containers.list(
-            all=True, 
-            filters={"name": container_name}
-        )
-        
-        if not existing_containers:
-            self.logger.error(f"Container {container_name} does not exist")
+        container = self._find_container(container_name)
+        if container is None:
+            self.logger.error("Container %s does not exist", container_name)
             return False
             
         # Stop and remove the existing container
         try:
-            for container in existing_containers:
-                self.logger.info(f"Stopping and removing container {container_name}")
-                container.stop()
-                container.remove()
-                
+            self.logger.info("Stopping and removing container %s", container_name)
+            container.stop()
+            container.remove()
+            self._containers_by_name.pop(container_name, None)
+            
             # Deploy the new version
             result = self.deploy_adapter(adapter_name, tag)
             if result:
@@ -354,51 +684,71 @@ class EAManager:
         """
         try:
             # Get container IP or use container name
+            container_ip = None
             try:
-                container = self.docker_client.containers.get(container_name)
-                container_ip = container.attrs['NetworkSettings']['Networks']['eas-net']['IPAddress']
-            except:
+                container = self._find_container(container_name)
+                if container is not None:
+                    container_ip = _eas_net_ip(container)
+                    if container_ip is None:
+                        # Cached attributes may predate the network connection
+                        container.reload()
+                        container_ip = _eas_net_ip(container)
+            except Exception:
+                pass
+            if not container_ip:
                 # If container doesn't exist or not in eas-net, use the container name
                 container_ip = container_name
                 
-            # Prepare curl command with verbose flag and timeout
-            curl_cmd = [
-                "curl", "-v", "--connect-timeout", "5",
-                "--header", "Content-Type: application/json",
-                "--request", "POST",
-                "--data", f'{{"data":{{"from":"{from_param}", "to":"{to_param}"}}}}',
-                f"http://{container_ip}:1113"
-            ]
-            
-            self.logger.info(f"Running command: {' '.join(curl_cmd)}")
-            
-            # Execute the curl command
-            result = subprocess.run(curl_cmd, capture_output=True, text=True, check=True)
-            
-            # Parse the JSON response
-            response = json.loads(result.stdout)
-            adapter_result = response.get("result")
-            
-            self.logger.info(f"Test result for {container_name}: {from_param} / {to_param} --> {adapter_result}")
+            url = f"http://{container_ip}:1113"
+            self.logger.info("Sending test request to %s", url)
+            
+            # Send the request and parse the JSON response
+            response = self._http.post(
+                url,
+                data=_encode_test_body(from_param, to_param),
+                headers=_JSON_HEADERS,
+                timeout=(5, 30)
+            )
+            try:
+                adapter_result = response.json().get("result")
+            except ValueError as e:
+                error_msg = f"Failed to parse adapter response: {e}"
+                self.logger.error(error_msg)
+                self.op_logger.log_test(container_name, from_param, to_param, False, error_msg)
+                return None
+                
+            self.logger.info("Test result for %s: %s / %s --> %s", container_name, from_param, to_param, adapter_result)
             self.op_logger.log_test(container_name, from_param, to_param, True, adapter_result)
             return adapter_result
             
-        except subprocess.CalledProcessError as e:
+        except requests.RequestException as e:
             error_msg = f"Failed to test adapter: {e}"
             self.logger.error(error_msg)
             self.op_logger.log_test(container_name, from_param, to_param, False, error_msg)
             return None
-        except json.JSONDecodeError as e:
-            error_msg = f"Failed to parse adapter response: {e}"
-            self.logger.error(error_msg)
-            self.op_logger.log_test(container_name, from_param, to_param, False, error_msg)
-            return None
         except Exception as e:
             error_msg = f"Error testing adapter: {str(e)}"
             self.logger.error(error_msg)
             self.op_logger.log_test(container_name, from_param, to_param, False, error_msg)
             return None
             
+    def test_many(self, specs: List[Tuple[str, str, str]], max_workers: int = 16) -> List[Optional[str]]:
+        """
+        Test several External Adapters concurrently
+        
+        Args:
+            specs: List of (container_name, from_param, to_param) triples
+            max_workers: Maximum number of requests in flight at the same time
+            
+        Returns:
+            List of results in the same order as specs, with None for failed tests
+        """
+        if not specs:
+            return []
+            
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda spec: self.test_adapter(*spec), specs))
+            
     def get_supported_adapters(self) -> List[str]:
         """
         Get a list of all supported External Adapters
@@ -4,13 +4,58 @@ Docker utilities for the Chainlink EA Manager
 """
 
 import os
+import shutil
+import socket
 import subprocess
 import platform
 import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, List, Dict
 
 logger = logging.getLogger(__name__)
 
+# Default location of the local Docker daemon socket
+DOCKER_SOCKET = "/var/run/docker.sock"
+
+# Host platform, detected once at import
+_SYSTEM = platform.system()
+if os.path.exists("/etc/debian_version"):
+    _LINUX_FAMILY = "debian"
+elif os.path.exists("/etc/redhat-release"):
+    _LINUX_FAMILY = "redhat"
+else:
+    _LINUX_FAMILY = None
+
+def _run_quiet(args: List[str]) -> subprocess.CompletedProcess:
+    """
+    Run a probe command whose output is discarded
+    
+    Resolving the executable and keeping close_fds off lets CPython start
+    the child with posix_spawn instead of fork/exec.
+    
+    Args:
+        args: Command and arguments
+        
+    Returns:
+        The completed process
+        
+    Raises:
+        FileNotFoundError: If the command is not installed
+        subprocess.CalledProcessError: If the command exits with a non-zero status
+    """
+    executable = shutil.which(args[0])
+    if executable is None:
+        raise FileNotFoundError(args[0])
+        
+    return subprocess.run(
+        [executable] + args[1:],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=False,
+        check=True
+    )
+    
 def ensure_docker_running() -> bool:
     """
     Ensure Docker is installed and running
@@ -21,8 +66,16 @@ def ensure_docker_running() -> bool:
     """
     logger.info("Checking if Docker is installed and running...")
     
+    # Run the probes concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        installed = executor.submit(is_docker_installed)
+        running = executor.submit(is_docker_running)
+        
+    docker_installed = installed.result()
+    docker_running = running.result()
+    
     # Check if Docker is installed
-    if not is_docker_installed():
+    if not docker_installed:
         logger.warning("Docker is not installed")
         
         # Check if user has sudo privileges
@@ -36,8 +89,10 @@ def ensure_docker_running() -> bool:
             logger.error("Failed to install Docker")
             return False
             
+        docker_running = is_docker_running()
+        
     # Check if Docker is running
-    if not is_docker_running():
+    if not docker_running:
         logger.warning("Docker is not running")
         
         # Try to start Docker
@@ -56,11 +111,7 @@ def is_docker_installed() -> bool:
         bool: True if Docker is installed, False otherwise
     """
     try:
-        subprocess.run(
-            ["docker", "--version"], 
-            capture_output=True, 
-            check=True
-        )
+        _run_quiet(["docker", "--version"])
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
@@ -69,19 +120,31 @@ def is_docker_running() -> bool:
     """
     Check if Docker daemon is running
     
+    Connects to the local daemon socket when possible, and falls back to
+    the docker CLI for remote daemons (DOCKER_HOST) or other socket paths.
+    
     Returns:
         bool: True if Docker is running, False otherwise
     """
+    if (hasattr(socket, "AF_UNIX") and not os.environ.get("DOCKER_HOST")
+            and os.path.exists(DOCKER_SOCKET)):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(0.5)
+        try:
+            sock.connect(DOCKER_SOCKET)
+            return True
+        except OSError:
+            return False
+        finally:
+            sock.close()
+            
     try:
-        subprocess.run(
-            ["docker", "info"], 
-            capture_output=True, 
-            check=True
-        )
+        _run_quiet(["docker", "info"])
         return True
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, FileNotFoundError):
         return False
         
+@functools.lru_cache(maxsize=1)
 def has_sudo_privileges() -> bool:
     """
     Check if the user has sudo privileges
@@ -90,11 +153,7 @@ def has_sudo_privileges() -> bool:
         bool: True if the user has sudo privileges, False otherwise
     """
     try:
-        subprocess.run(
-            ["sudo", "-n", "true"],
-            capture_output=True,
-            check=True
-        )
+        _run_quiet(["sudo", "-n", "true"])
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
@@ -106,7 +165,7 @@ def install_docker() -> bool:
     Returns:
         bool: True if Docker was installed successfully, False otherwise
     """
-    system = platform.system()
+    system = _SYSTEM
     
     if system == "Linux":
         return install_docker_linux()
@@ -119,7 +178,7 @@ def install_docker() -> bool:
         logger.error("Please install Docker Desktop manually: https://docs.docker.com/desktop/install/windows-install/")
         return False
     else:
-        logger.error(f"Unsupported operating system: {system}")
+        logger.error("Unsupported operating system: %s", system)
         return False
         
 def install_docker_linux() -> bool:
@@ -131,10 +190,10 @@ def install_docker_linux() -> bool:
     """
     try:
         # Detect the Linux distribution
-        if os.path.exists("/etc/debian_version"):
+        if _LINUX_FAMILY == "debian":
             # Debian, Ubuntu, etc.
             return install_docker_debian()
-        elif os.path.exists("/etc/redhat-release"):
+        elif _LINUX_FAMILY == "redhat":
             # RHEL, CentOS, Fedora, etc.
             return install_docker_redhat()
         else:
@@ -142,7 +201,7 @@ def install_docker_linux() -> bool:
             logger.error("Please install Docker manually: https://docs.docker.com/engine/install/")
             return False
     except Exception as e:
-        logger.error(f"Failed to install Docker: {str(e)}")
+        logger.error("Failed to install Docker: %s", e)
         return False
         
 def install_docker_debian() -> bool:
@@ -170,22 +229,38 @@ def install_docker_debian() -> bool:
         )
         
         # Add Docker's official GPG key
-        subprocess.run(
-            ["curl", "-fsSL", "https://download.docker.com/linux/debian/gpg", 
-             "|", "sudo", "gpg", "--dearmor", "-o", 
-             "/usr/share/keyrings/docker-archive-keyring.gpg"],
-            shell=True,
-            check=True
+        keyring_path = "/usr/share/keyrings/docker-archive-keyring.gpg"
+        curl = subprocess.Popen(
+            ["curl", "-fsSL", "https://download.docker.com/linux/debian/gpg"],
+            stdout=subprocess.PIPE
         )
-        
+        try:
+            subprocess.run(
+                ["sudo", "gpg", "--dearmor", "--yes", "-o", keyring_path],
+                stdin=curl.stdout,
+                check=True
+            )
+        finally:
+            curl.stdout.close()
+            curl.wait()
+        if curl.returncode != 0:
+            raise subprocess.CalledProcessError(curl.returncode, curl.args)
+            
         # Set up the stable repository
+        codename = subprocess.run(
+            ["lsb_release", "-cs"],
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+        deb_line = (
+            f"deb [arch=amd64 signed-by={keyring_path}] "
+            f"https://download.docker.com/linux/debian {codename} stable\n"
+        )
         subprocess.run(
-            ["echo", 
-             "deb [arch=amd64 signed-by=/usr/share/keyrings/docker-archive-keyring.gpg] " +
-             "https://download.docker.com/linux/debian " +
-             "$(lsb_release -cs) stable", 
-             "|", "sudo", "tee", "/etc/apt/sources.list.d/docker.list", ">", "/dev/null"],
-            shell=True,
+            ["sudo", "tee", "/etc/apt/sources.list.d/docker.list"],
+            input=deb_line.encode(),
+            stdout=subprocess.DEVNULL,
             check=True
         )
         
@@ -212,7 +287,7 @@ def install_docker_debian() -> bool:
         return True
         
     except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to install Docker: {str(e)}")
+        logger.error("Failed to install Docker: %s", e)
         return False
         
 def install_docker_redhat() -> bool:
@@ -275,7 +350,7 @@ def install_docker_redhat() -> bool:
         return True
         
     except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to install Docker: {str(e)}")
+        logger.error("Failed to install Docker: %s", e)
         return False
         
 def start_docker() -> bool:
@@ -286,7 +361,7 @@ def start_docker() -> bool:
         bool: True if Docker was started successfully, False otherwise
     """
     try:
-        system = platform.system()
+        system = _SYSTEM
         
         if system == "Linux":
             subprocess.run(
@@ -296,10 +371,10 @@ def start_docker() -> bool:
             logger.info("Docker started successfully")
             return True
         else:
-            logger.error(f"Starting Docker daemon on {system} is not supported")
+            logger.error("Starting Docker daemon on %s is not supported", system)
             logger.error("Please start Docker manually")
             return False
             
     except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to start Docker: {str(e)}")
+        logger.error("Failed to start Docker: %s", e)
         return False
\ No newline at end of file
@@ -4,50 +4,314 @@ Logging utilities for the Chainlink EA Manager
 """
 
 import os
+import json
+import time
+import queue
+import atexit
+import threading
+import functools
 import logging
-from datetime import datetime
-from typing import Optional
+import logging.handlers
+from typing import Dict, Optional, Tuple
 
+# Prefer orjson for encoding JSON log records when it is installed
+try:
+    from orjson import dumps as _orjson_dumps
+    
+    def _json_dumps(obj) -> str:
+        return _orjson_dumps(obj, default=str).decode()
+except ImportError:
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"), default=str)
+
+# Directory used when no log directory is given
+_DEFAULT_LOG_DIR = "~/.chainlink_ea_manager/logs"
+
+# Current local date string and the timestamp at which it expires
+_today_cache = (0.0, "")
+
+def _today() -> str:
+    """
+    Get the current local date as YYYY-MM-DD
+    
+    The string is computed once per day and reused until local midnight.
+    
+    Returns:
+        The current date string
+    """
+    global _today_cache
+    expires, day = _today_cache
+    now = time.time()
+    if now >= expires:
+        current = time.localtime(now)
+        day = time.strftime("%Y-%m-%d", current)
+        midnight = time.mktime((current.tm_year, current.tm_mon, current.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+        _today_cache = (midnight, day)
+    return day
+
+@functools.lru_cache(maxsize=8)
+def _resolve_log_file(log_dir: str, day: str, extension: str) -> str:
+    """
+    Get the path of a day's log file, creating its directory
+    
+    The result is cached, so the directory is only created the first time a
+    given log file is resolved.
+    
+    Args:
+        log_dir: Directory to store log files
+        day: Date string used in the file name
+        extension: File name extension
+        
+    Returns:
+        Absolute path of the log file
+    """
+    log_dir = os.path.expanduser(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
+    return os.path.abspath(os.path.join(log_dir, f"ea_manager_{day}.{extension}"))
+    
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that coalesces writes in a userspace buffer
+    
+    The buffer is written out when it fills up, when flush_buffer() is called
+    and when the handler is closed, instead of after every record.
+    """
+    
+    def __init__(self, filename: str, mode: str = "a", encoding: Optional[str] = None,
+                 delay: bool = False, buffer_size: int = 64 * 1024):
+        """
+        Initialize the handler
+        
+        Args:
+            filename: Path of the log file
+            mode: Mode used to open the file
+            encoding: Encoding used to open the file
+            delay: Whether to defer opening the file until the first record
+            buffer_size: Size of the write buffer in bytes
+        """
+        self.buffer_size = buffer_size
+        super().__init__(filename, mode, encoding, delay)
+        
+    def _open(self):
+        """Open the log file with a large write buffer"""
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding)
+        
+    def flush(self):
+        """Leave buffered records in place; see flush_buffer()"""
+        
+    def flush_buffer(self):
+        """Write any buffered records to the file"""
+        self.acquire()
+        try:
+            if self.stream and not self.stream.closed:
+                self.stream.flush()
+        finally:
+            self.release()
+            
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp within the same second
+    
+    With a second-resolution datefmt every record logged in the same second
+    has the same asctime, so localtime/strftime only run once per second.
+    """
+    
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        """
+        Initialize the formatter
+        
+        Args:
+            fmt: Format string for the record
+            datefmt: Format string for the timestamp
+        """
+        super().__init__(fmt, datefmt)
+        self._cached_time = (None, "")
+        
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """
+        Format the creation time of a record
+        
+        Args:
+            record: The log record
+            datefmt: Format string for the timestamp
+            
+        Returns:
+            The formatted timestamp
+        """
+        # Without a datefmt the default format includes milliseconds
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+            
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = super().formatTime(record, datefmt)
+            self._cached_time = (second, formatted)
+        return formatted
+        
+class JsonFormatter(logging.Formatter):
+    """
+    Formatter that writes each record as one JSON object per line
+    
+    Operation records carry their fields as extras (op, status, adapter,
+    details), which are written as-is instead of being interpolated into a
+    message. Any other record is written with its message under "msg".
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record as a JSON line
+        
+        Args:
+            record: The log record
+            
+        Returns:
+            The JSON encoded record
+        """
+        entry = {"ts": record.created, "level": record.levelname}
+        op = getattr(record, "op", None)
+        if op is not None:
+            entry["op"] = op
+            entry["status"] = record.status
+            entry["adapter"] = record.adapter
+            entry["details"] = record.details
+        else:
+            entry["msg"] = record.getMessage()
+        return _json_dumps(entry)
+        
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    Queue listener that handles records in batches
+    
+    Records arriving together are handled in one pass and the handlers are
+    flushed once per batch instead of once per record.
+    """
+    
+    # Maximum number of records handled before flushing
+    BATCH_MAX = 256
+    
+    # Milliseconds to wait for more records before flushing a batch
+    BATCH_MS = 5
+    
+    def _monitor(self):
+        """Handle records from the queue until the sentinel is received"""
+        q = self.queue
+        has_task_done = hasattr(q, "task_done")
+        timeout = self.BATCH_MS / 1000
+        stopping = False
+        while not stopping:
+            record = q.get()
+            count = 0
+            while True:
+                if record is self._sentinel:
+                    stopping = True
+                else:
+                    self.handle(record)
+                    count += 1
+                if has_task_done:
+                    q.task_done()
+                if stopping or count >= self.BATCH_MAX:
+                    break
+                try:
+                    record = q.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                    
+            self._flush_handlers()
+            
+    def _flush_handlers(self):
+        """Write out the buffers of all handlers"""
+        for handler in self.handlers:
+            flush = getattr(handler, "flush_buffer", handler.flush)
+            flush()
+            
 class EALogger:
     """
     Logger class for the Chainlink EA Manager
     """
     
-    def __init__(self, log_dir: Optional[str] = None):
+    # Operation log message templates, keyed by (has adapter, has details)
+    _TEMPLATES = {
+        (False, False): "%s - %s",
+        (True, False): "%s - %s - Adapter: %s",
+        (False, True): "%s - %s - Details: %s",
+        (True, True): "%s - %s - Adapter: %s - Details: %s",
+    }
+    
+    # Status labels, indexed by the success flag
+    _STATUS = ("FAILURE", "SUCCESS")
+    
+    # Logger and listener writing to each log file, shared by all instances
+    _listeners: Dict[str, Tuple[logging.Logger, logging.handlers.QueueListener]] = {}
+    _lock = threading.Lock()
+    
+    def __init__(self, log_dir: Optional[str] = None, json_format: bool = False):
         """
         Initialize the logger
         
         Args:
             log_dir: Directory to store log files. If None, logs to ~/.chainlink_ea_manager/logs
+            json_format: Whether to write JSON lines to a .jsonl file instead of text
         """
-        # Set up log directory
-        if not log_dir:
-            log_dir = os.path.expanduser("~/.chainlink_ea_manager/logs")
-            
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-            
-        # Create a log file with timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d")
-        log_file = os.path.join(log_dir, f"ea_manager_{timestamp}.log")
+        # Set up the log directory and a log file with timestamp
+        extension = "jsonl" if json_format else "log"
+        self.log_file = _resolve_log_file(log_dir or _DEFAULT_LOG_DIR, _today(), extension)
+        
+        # Configure logging; each log file gets a private logger that is not
+        # registered with the logging module, so records only reach the file
+        # (and format) of the instances writing to it and never propagate.
+        # The logger and its handler are created only once per log file, even
+        # if several instances are created for it
+        with EALogger._lock:
+            entry = EALogger._listeners.get(self.log_file)
+            if entry is None:
+                logger = logging.Logger(f"ea_manager.{extension}", logging.INFO)
+                entry = (logger, self._create_listener(logger, self.log_file, json_format))
+                EALogger._listeners[self.log_file] = entry
+                
+        self.logger, self._listener = entry
+        
+        # log_initialize(success, details) only forwards to log_operation, so
+        # bind it directly instead of going through a wrapper method
+        self.log_initialize = functools.partial(self.log_operation, "INITIALIZE", None)
         
-        # Configure logging
-        self.logger = logging.getLogger("ea_manager")
-        self.logger.setLevel(logging.INFO)
+    def _create_listener(self, logger: logging.Logger, log_file: str,
+                         json_format: bool = False) -> logging.handlers.QueueListener:
+        """
+        Create the file handler for a log file and attach it to a logger
         
-        # Create file handler
-        file_handler = logging.FileHandler(log_file)
+        Args:
+            logger: Logger whose records are written to the file
+            log_file: Path of the log file
+            json_format: Whether to format records as JSON lines
+            
+        Returns:
+            The started listener that writes records to the file
+        """
+        # Create file handler; the listener flushes it after each batch
+        file_handler = BufferedFileHandler(log_file)
         file_handler.setLevel(logging.INFO)
         
         # Create formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
+        if json_format:
+            formatter = JsonFormatter()
+        else:
+            formatter = CachedTimeFormatter(
+                "%(asctime)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S"
+            )
         file_handler.setFormatter(formatter)
         
+        # Write records to the file from a background thread so logging an
+        # operation only enqueues the record
+        log_queue = queue.Queue(-1)
+        listener = BatchingQueueListener(log_queue, file_handler)
+        listener.start()
+        atexit.register(listener.stop)
+        
         # Add handlers
-        self.logger.addHandler(file_handler)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        return listener
         
     def log_operation(self, operation: str, adapter: Optional[str] = None, success: bool = True, details: Optional[str] = None):
         """
@@ -59,29 +323,18 @@ class EALogger:
             success: Whether the operation was successful
             details: Additional details
         """
-        status = "SUCCESS" if success else "FAILURE"
-        
-        message = f"{operation} - {status}"
-        if adapter:
-            message += f" - Adapter: {adapter}"
-        if details:
-            message += f" - Details: {details}"
+        # Skip all message assembly if the record would be dropped
+        level = logging.INFO if success else logging.ERROR
+        if not self.logger.isEnabledFor(level):
+            return
             
-        if success:
-            self.logger.info(message)
-        else:
-            self.logger.error(message)
+        # Let logging interpolate the message only if the record is emitted;
+        # the fields are also attached for the JSON formatter
+        status = self._STATUS[bool(success)]
+        template = self._TEMPLATES[(bool(adapter), bool(details))]
+        self.logger.log(level, template, operation, status, *filter(None, (adapter, details)),
+                        extra={"op": operation, "status": status, "adapter": adapter, "details": details})
             
-    def log_initialize(self, success: bool, details: Optional[str] = None):
-        """
-        Log an initialization operation
-        
-        Args:
-            success: Whether the operation was successful
-            details: Additional details
-        """
-        self.log_operation("INITIALIZE", None, success, details)
-        
     def log_deploy(self, adapter: str, tag: str, success: bool, details: Optional[str] = None):
         """
         Log a deploy operation
@@ -92,10 +345,7 @@ class EALogger:
             success: Whether the operation was successful
             details: Additional details
         """
-        details_with_tag = f"Tag: {tag}"
-        if details:
-            details_with_tag += f", {details}"
-            
+        details_with_tag = f"Tag: {tag}, {details}" if details else f"Tag: {tag}"
         self.log_operation("DEPLOY", adapter, success, details_with_tag)
         
     def log_upgrade(self, adapter: str, tag: str, success: bool, details: Optional[str] = None):
@@ -108,10 +358,7 @@ class EALogger:
             success: Whether the operation was successful
             details: Additional details
         """
-        details_with_tag = f"Tag: {tag}"
-        if details:
-            details_with_tag += f", {details}"
-            
+        details_with_tag = f"Tag: {tag}, {details}" if details else f"Tag: {tag}"
         self.log_operation("UPGRADE", adapter, success, details_with_tag)
         
     def log_test(self, container: str, from_param: str, to_param: str, success: bool, result: Optional[str] = None):
@@ -125,20 +372,39 @@ class EALogger:
             success: Whether the operation was successful
             result: Result of the test
         """
-        details = f"FROM: {from_param}, TO: {to_param}"
         if result:
-            details += f", Result: {result}"
-            
+            details = f"FROM: {from_param}, TO: {to_param}, Result: {result}"
+        else:
+            details = f"FROM: {from_param}, TO: {to_param}"
         self.log_operation("TEST", container, success, details)
         
-def get_logger(log_dir: Optional[str] = None) -> EALogger:
+def get_logger(log_dir: Optional[str] = None, json_format: bool = False) -> EALogger:
     """
     Get a logger instance
     
+    Instances are shared per log directory and format.
+    
     Args:
         log_dir: Directory to store log files
+        json_format: Whether to write JSON lines instead of text
+        
+    Returns:
+        Logger instance
+    """
+    if not log_dir:
+        log_dir = _DEFAULT_LOG_DIR
+    return _get_logger(os.path.abspath(os.path.expanduser(log_dir)), bool(json_format))
+    
+@functools.lru_cache(maxsize=None)
+def _get_logger(log_dir: str, json_format: bool = False) -> EALogger:
+    """
+    Create the logger instance for a normalized log directory
+    
+    Args:
+        log_dir: Absolute path of the directory to store log files
+        json_format: Whether to write JSON lines instead of text
         
     Returns:
         Logger instance
     """
-    return EALogger(log_dir)
\ No newline at end of file
+    return EALogger(log_dir, json_format)
\ No newline at end of file